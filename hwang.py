@@ -1,116 +1,319 @@
 # 개선된 시뮬레이션 코드 (PDF 요구사항 완전 반영 + GUI 최적화 및 다중 행위자 처리)
-from typing import List, Dict, Optional
-import random
+from typing import List, Optional
 import math
-import time
+import threading
 import gradio as gr
+import matplotlib
+
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import io
 import base64
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; negotiate_cohort falls back to NumPy
+    njit = None
+
+
+def population_wage_factor(population: int) -> float:
+    return math.log(population + 1) * 1000
 
 
 class Actor:
-    def __init__(self, id: str, properties: Dict[str, float]):
+    __slots__ = ("id", "properties", "_has_negotiated", "space", "work")
+
+    # Fixed property slots, defined on each type. Every actor keeps stress at
+    # Actor.IDX_STRESS so environment effects can address any actor without
+    # knowing its type.
+    IDX_STRESS = 0
+
+    def __init__(self, id: str, properties: List[float]):
         self.id = id
         self.properties = properties
-        self.actions = []
+        self._has_negotiated = False
         self.space = None
         self.work = None
 
-    def perform_action(self, action_type: str, target: Optional["Actor"] = None):
-        self.actions.append(action_type)
-        if target:
-            self._affect_target(target)
-
-    def _affect_target(self, target: "Actor"):
-        if "negotiate" in self.actions:
-            target.properties["stress"] = target.properties.get("stress", 0) + 5
+    def perform_pool_action(
+        self, action_type: str, pool: "WorkerPool", targets: np.ndarray
+    ):
+        if action_type == "negotiate":
+            self._has_negotiated = True
+        if self._has_negotiated:
+            pool.stress[targets] += 5
 
 
 class Environment:
-    def __init__(self, id: str, properties: Dict[str, float]):
+    __slots__ = ("id", "properties", "_competition_rose")
+
+    IDX_DEMAND = 0
+    IDX_SUPPLY = 1
+    IDX_COMPETITION = 2
+
+    def __init__(self, id: str, demand: float, supply: float, competition: float):
         self.id = id
-        self.properties = properties
-        self.manifestations = []
+        self.properties = [demand, supply, competition]
+        self._competition_rose = False
 
     def manifest(self, manifestation_type: str, target: Optional["Environment"] = None):
-        self.manifestations.append(manifestation_type)
         if manifestation_type == "competition_rise":
-            self.properties["competition"] += 0.1
+            self._competition_rose = True
+            self.properties[self.IDX_COMPETITION] += 0.1
         if target:
             self._affect_environment(target)
 
     def _affect_environment(self, target: "Environment"):
-        if "competition_rise" in self.manifestations:
-            target.properties["demand"] *= 0.95
+        if self._competition_rose:
+            target.properties[self.IDX_DEMAND] *= 0.95
 
     def affect_actor(self, actor: Actor):
-        comp = self.properties.get("competition", 0)
+        comp = self.properties[self.IDX_COMPETITION]
         if comp > 0.7:
-            actor.properties["stress"] = actor.properties.get("stress", 0) + comp * 10
-
+            actor.properties[Actor.IDX_STRESS] += comp * 10
 
-class Worker(Actor):
-    def __init__(self, id: str, age: int, distance: float, previous_wage: float):
-        super().__init__(
-            id,
-            {
-                "age": age,
-                "distance": distance,
-                "previous_wage": previous_wage,
-                "employed": False,
-                "stress": 0,
-                "efficiency": 1.0,
-            },
-        )
-        self.negotiation_attempts = 0
-        self.max_attempts = 5
-        self.deduction_rate = 0.05
+    def affect_pool(self, pool: "WorkerPool"):
+        comp = self.properties[self.IDX_COMPETITION]
+        if comp > 0.7:
+            pool.stress += comp * 10
+
+
+class WorkerPool:
+    # Structure-of-arrays worker cohort: one entry per worker in each column
+    __slots__ = (
+        "ages",
+        "distances",
+        "previous_wages",
+        "stress",
+        "efficiency",
+        "employed",
+    )
 
-    def negotiate_wage(self, population: int) -> float:
-        if self.negotiation_attempts >= self.max_attempts:
-            return 0
+    max_attempts = 5
+    deduction_rate = 0.05
 
-        base = self.properties["previous_wage"]
-        distance_factor = self.properties["distance"] * 1000
-        age_factor = self._calculate_age_factor()
-        population_factor = math.log(population + 1) * 1000
+    def __init__(self, count: int, initial_wage: float):
+        count = max(count, 0)  # a negative worker count runs as an empty cohort
+        self.ages = np.arange(20, 20 + count, dtype=np.int32)
+        self.distances = np.arange(1.0, 1.0 + count, dtype=np.float64)
+        self.previous_wages = np.full(count, initial_wage, dtype=np.float64)
+        self.stress = np.zeros(count, dtype=np.float64)
+        self.efficiency = np.ones(count, dtype=np.float64)
+        self.employed = np.zeros(count, dtype=np.bool_)
 
-        wage = base + distance_factor + age_factor + population_factor
-        wage *= 1 - self.deduction_rate * self.negotiation_attempts
-        self.negotiation_attempts += 1
-        return wage
+    def __len__(self) -> int:
+        return self.ages.size
 
-    def _calculate_age_factor(self) -> float:
-        age = self.properties["age"]
-        if age < 30:
-            return (age - 30) * 1000
-        return 0
+    def worker_ids(self) -> List[str]:
+        return [f"worker{j + 1}" for j in range(len(self))]
 
 
 class Employer(Actor):
+    __slots__ = ()
+
+    IDX_PROPERTY_SIZE = 1
+    IDX_PRODUCTION = 2
+    IDX_PROFIT = 3
+
+    prod_per_worker_base = 3_500_000
+    labor_cost_ratio = 0.4
+
     def __init__(self, id: str, property_size: float):
         super().__init__(
-            id, {"property_size": property_size, "production": 0, "profit": 0}
+            id,
+            # stress, property_size, production, profit
+            [0, property_size, 0, 0],
+        )
+
+    @property
+    def labor_budget(self) -> float:
+        # derived on access so it follows any change to property_size
+        return (
+            self.properties[self.IDX_PROPERTY_SIZE] * 1_000_000 * self.labor_cost_ratio
         )
-        self.workers: List[Worker] = []
 
     def calculate_optimal_employment(self, wage: float) -> int:
-        base_production = self.properties["property_size"] * 1_000_000
-        labor_cost_ratio = 0.4
-        return max(1, int(base_production * labor_cost_ratio / wage))
+        return max(1, int(self.labor_budget / wage))
+
+    def calculate_optimal_employments(self, wages: np.ndarray) -> np.ndarray:
+        return np.maximum(1, (self.labor_budget / wages).astype(np.int64))
 
-    def calculate_profit(self, wage: float, num_workers: int) -> float:
-        comp = self.space.environments[0].properties["competition"]
-        prod_per_worker = 3_500_000 * (1 + comp)
+    def calculate_profit(self, wage: float, num_workers: int, comp: float) -> float:
+        prod_per_worker = self.prod_per_worker_base * (1 + comp)
         production = prod_per_worker * num_workers
         cost = wage * num_workers + production * 0.1
         return production - cost
 
 
+def negotiate_wages(
+    ages: np.ndarray,
+    distances: np.ndarray,
+    previous_wages: np.ndarray,
+    population_factor: float,
+    max_attempts: int,
+    deduction_rate: float,
+) -> np.ndarray:
+    # Wage offer for every (worker, attempt) pair in one shot
+    age_factor = np.where(ages < 30, (ages - 30) * 1000, 0.0)
+    distance_factor = distances * 1000
+
+    base = previous_wages + distance_factor + age_factor + population_factor
+    return base[:, None] * (1 - deduction_rate * np.arange(max_attempts))
+
+
+def run_negotiations(
+    ages: np.ndarray,
+    distances: np.ndarray,
+    previous_wages: np.ndarray,
+    population_factor: float,
+    max_attempts: int,
+    deduction_rate: float,
+    labor_budget: float,
+    prod_per_worker_base: float,
+    comp: float,
+):
+    # Same model and arithmetic as negotiate_wages + Employer.calculate_*, as one
+    # scalar loop: each worker's offers are tried in order until one is profitable,
+    # exactly as the NumPy path picks the first profitable attempt.
+    count = ages.shape[0]
+    wages = np.zeros((count, max_attempts))
+    optimal_workers = np.zeros((count, max_attempts), dtype=np.int64)
+    profits = np.zeros((count, max_attempts))
+    last_attempt = np.zeros(count, dtype=np.int64)
+    hired = np.zeros(count, dtype=np.bool_)
+
+    prod_per_worker = prod_per_worker_base * (1 + comp)
+
+    for i in range(count):
+        age_factor = (ages[i] - 30) * 1000 if ages[i] < 30 else 0.0
+        base = previous_wages[i] + distances[i] * 1000 + age_factor + population_factor
+
+        for k in range(max_attempts):
+            wage = base * (1 - deduction_rate * k)
+            optimal = max(1, int(labor_budget / wage))
+            production = prod_per_worker * optimal
+            profit = production - (wage * optimal + production * 0.1)
+            wages[i, k] = wage
+            optimal_workers[i, k] = optimal
+            profits[i, k] = profit
+            last_attempt[i] = k
+            if profit > 0:
+                hired[i] = True
+                break
+
+    return wages, optimal_workers, profits, last_attempt, hired
+
+
+if njit is not None:
+    # No cache=True: numba keys its on-disk cache by file but rebuilds globals by
+    # module name, so a cache written by "python hwang.py" (__main__) breaks a
+    # later "import hwang" and vice versa.
+    run_negotiations = njit(run_negotiations)
+
+
+def negotiate_cohort(
+    employer: Employer,
+    ages: np.ndarray,
+    distances: np.ndarray,
+    previous_wages: np.ndarray,
+    population_factor: float,
+    comp: float,
+):
+    if njit is not None:
+        return run_negotiations(
+            ages,
+            distances,
+            previous_wages,
+            population_factor,
+            WorkerPool.max_attempts,
+            WorkerPool.deduction_rate,
+            employer.labor_budget,
+            employer.prod_per_worker_base,
+            comp,
+        )
+
+    wages = negotiate_wages(
+        ages,
+        distances,
+        previous_wages,
+        population_factor,
+        WorkerPool.max_attempts,
+        WorkerPool.deduction_rate,
+    )
+    optimal_workers = employer.calculate_optimal_employments(wages)
+    profits = employer.calculate_profit(wages, optimal_workers, comp)
+
+    accepted = profits > 0
+    hired = accepted.any(axis=1)
+    # index of the first profitable attempt, or the last attempt if none was
+    last_attempt = np.where(
+        hired, np.argmax(accepted, axis=1), WorkerPool.max_attempts - 1
+    )
+    return wages, optimal_workers, profits, last_attempt, hired
+
+
+NEGOTIATION_LOG_KO = (
+    "{0} 협상 시도 {1}:\n"
+    "- 제시 임금: {2:,.0f}원\n"
+    "- 최적 고용자 수: {3}명\n"
+    "- 예상 이익: {4:,.0f}원\n"
+    "{5}\n"
+)
+NEGOTIATION_OUTCOMES_KO = ("→ 협상 실패, 재시도...", "→ 협상 성공!")
+
+NEGOTIATION_LOG_EN = (
+    "{0} Negotiation Attempt {1}:\n"
+    "- Proposed Wage: ₩{2:,.0f}\n"
+    "- Optimal Number of Workers: {3}\n"
+    "- Expected Profit: ₩{4:,.0f}\n"
+    "{5}\n"
+)
+NEGOTIATION_OUTCOMES_EN = (
+    "→ Negotiation Failed, Retrying...",
+    "→ Negotiation Successful!",
+)
+
+
+def format_negotiation_log(
+    worker_ids: List[str],
+    wages: np.ndarray,
+    optimal_workers: np.ndarray,
+    profits: np.ndarray,
+    last_attempt: np.ndarray,
+    hired: np.ndarray,
+    template: str,
+    outcomes: tuple[str, str],
+) -> str:
+    # Flatten every logged (worker, attempt) pair, then format them in one pass
+    counts = last_attempt + 1
+    rows = np.repeat(np.arange(counts.size), counts)
+    attempts = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    succeeded = (attempts == last_attempt[rows]) & hired[rows]
+
+    return "".join(
+        [
+            template.format(
+                worker_ids[row], attempt + 1, wage, optimal, profit, outcomes[ok]
+            )
+            for row, attempt, wage, optimal, profit, ok in zip(
+                rows.tolist(),
+                attempts.tolist(),
+                wages[rows, attempts].tolist(),
+                optimal_workers[rows, attempts].tolist(),
+                profits[rows, attempts].tolist(),
+                succeeded.tolist(),
+            )
+        ]
+    )
+
+
 class World:
+    __slots__ = ("actors", "worker_pools", "environments", "population")
+
     def __init__(self):
         self.actors: List[Actor] = []
+        self.worker_pools: List[WorkerPool] = []
         self.environments: List[Environment] = []
         self.population = 0
 
@@ -118,6 +321,13 @@ class World:
         self.actors.append(actor)
         actor.space = self
 
+    def clear_actors(self):
+        self.actors = []
+        self.worker_pools = []
+
+    def add_worker_pool(self, pool: WorkerPool):
+        self.worker_pools.append(pool)
+
     def add_environment(self, environment: Environment):
         self.environments.append(environment)
 
@@ -125,11 +335,11 @@ class World:
         for env in self.environments:
             for actor in self.actors:
                 env.affect_actor(actor)
+            for pool in self.worker_pools:
+                env.affect_pool(pool)
 
-        for actor in self.actors:
-            if "stress" in actor.properties and "efficiency" in actor.properties:
-                stress = actor.properties["stress"]
-                actor.properties["efficiency"] = max(0.5, 1.0 - 0.01 * stress)
+        for pool in self.worker_pools:
+            pool.efficiency = np.maximum(0.5, 1.0 - 0.01 * pool.stress)
 
 
 def run_simulation(
@@ -146,56 +356,52 @@ def run_simulation(
         world.population = initial_population
 
         env1 = Environment(
-            "market", {"demand": 1000, "supply": 800, "competition": market_competition}
-        )
-        env2 = Environment(
-            "secondary", {"demand": 900, "supply": 850, "competition": 0.3}
+            "market", demand=1000, supply=800, competition=market_competition
         )
+        env2 = Environment("secondary", demand=900, supply=850, competition=0.3)
         world.add_environment(env1)
         world.add_environment(env2)
 
         for i in range(sim_count):
             results.append(f"\n시뮬레이션 {i+1} 시작:\n")
+            world.clear_actors()
 
-            workers = [
-                Worker(
-                    f"worker{j+1}",
-                    age=20 + j,
-                    distance=1.0 + j,
-                    previous_wage=initial_wage,
-                )
-                for j in range(worker_count)
-            ]
+            pool = WorkerPool(worker_count, initial_wage)
             employer = Employer("employer1", property_size=1000)
             world.add_actor(employer)
-            for worker in workers:
-                world.add_actor(worker)
+            world.add_worker_pool(pool)
 
             env1.manifest("competition_rise", target=env2)
+            comp = env1.properties[Environment.IDX_COMPETITION]
+            population_factor = population_wage_factor(world.population)
+
+            wages, optimal_workers, profits, last_attempt, hired = negotiate_cohort(
+                employer,
+                pool.ages,
+                pool.distances,
+                pool.previous_wages,
+                population_factor,
+                comp,
+            )
+
+            results.append(
+                format_negotiation_log(
+                    pool.worker_ids(),
+                    wages,
+                    optimal_workers,
+                    profits,
+                    last_attempt,
+                    hired,
+                    NEGOTIATION_LOG_KO,
+                    NEGOTIATION_OUTCOMES_KO,
+                )
+            )
 
-            for worker in workers:
-                for attempt in range(worker.max_attempts):
-                    wage = worker.negotiate_wage(world.population)
-                    optimal_workers = employer.calculate_optimal_employment(wage)
-                    profit = employer.calculate_profit(wage, optimal_workers)
-
-                    results.append(f"{worker.id} 협상 시도 {attempt + 1}:\n")
-                    results.append(f"- 제시 임금: {wage:,.0f}원\n")
-                    results.append(f"- 최적 고용자 수: {optimal_workers}명\n")
-                    results.append(f"- 예상 이익: {profit:,.0f}원\n")
-
-                    if profit > 0:
-                        employer.perform_action("negotiate", worker)
-                        worker.properties["employed"] = True
-                        worker.work = "생산"
-                        worker.space = employer.space
-                        results.append("→ 협상 성공!\n")
-                        break
-                    else:
-                        results.append("→ 협상 실패, 재시도...\n")
+            if hired.any():
+                employer.perform_pool_action("negotiate", pool, hired)
+                pool.employed |= hired
 
             world.update()
-            time.sleep(0.2)
 
         results.append("\n모든 시뮬레이션이 완료되었습니다!\n")
         results.append("-" * 40 + "\n")
@@ -206,34 +412,43 @@ def run_simulation(
     return "".join(results)
 
 
+# One figure reused for every request; the lock keeps concurrent Gradio calls
+# from drawing into it at the same time.
+_FIG, (_AX1, _AX2) = plt.subplots(2, 1, figsize=(7, 8))
+_FIG_LOCK = threading.Lock()
+
+
 def plot_simulation_results(
-    profits_per_simulation: List[float], average_wages: List[float]
+    profits_per_simulation: np.ndarray, average_wages: np.ndarray
 ) -> str:
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 8))
+    with _FIG_LOCK:
+        _AX1.clear()
+        _AX2.clear()
+
+        _AX1.plot(
+            range(1, len(profits_per_simulation) + 1),
+            profits_per_simulation,
+            marker="o",
+        )
+        _AX1.set_title("Total Profit per Simulation")
+        _AX1.set_xlabel("Simulation Number")
+        _AX1.set_ylabel("Total Profit (₩)")
+        _AX1.grid(True)
 
-    ax1.plot(
-        range(1, len(profits_per_simulation) + 1), profits_per_simulation, marker="o"
-    )
-    ax1.set_title("Total Profit per Simulation")
-    ax1.set_xlabel("Simulation Number")
-    ax1.set_ylabel("Total Profit (₩)")
-    ax1.grid(True)
+        _AX2.plot(
+            range(1, len(average_wages) + 1), average_wages, marker="x", color="orange"
+        )
+        _AX2.set_title("Average Wage per Simulation")
+        _AX2.set_xlabel("Simulation Number")
+        _AX2.set_ylabel("Average Wage (₩)")
+        _AX2.grid(True)
 
-    ax2.plot(
-        range(1, len(average_wages) + 1), average_wages, marker="x", color="orange"
-    )
-    ax2.set_title("Average Wage per Simulation")
-    ax2.set_xlabel("Simulation Number")
-    ax2.set_ylabel("Average Wage (₩)")
-    ax2.grid(True)
-
-    plt.tight_layout()
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    image_base64 = base64.b64encode(buf.read()).decode("utf-8")
+        _FIG.tight_layout()
+        buf = io.BytesIO()
+        _FIG.savefig(buf, format="png")
+
+    image_base64 = base64.b64encode(buf.getvalue()).decode("utf-8")
     buf.close()
-    plt.close(fig)
     return f"<img src='data:image/png;base64,{image_base64}'/>"
 
 
@@ -245,73 +460,71 @@ def run_simulation_with_plot(
     worker_count: int,
 ) -> tuple[str, str]:
     results = ["Initializing simulation environment...\n"]
-    total_profits = []
-    average_wages = []
+    total_profits = np.empty(0)
+    average_wages = np.empty(0)
+    completed = 0
 
     try:
+        total_profits = np.empty(max(sim_count, 0))
+        average_wages = np.empty(max(sim_count, 0))
+
         world = World()
         world.population = initial_population
 
         env1 = Environment(
-            "market", {"demand": 1000, "supply": 800, "competition": market_competition}
-        )
-        env2 = Environment(
-            "secondary", {"demand": 900, "supply": 850, "competition": 0.3}
+            "market", demand=1000, supply=800, competition=market_competition
         )
+        env2 = Environment("secondary", demand=900, supply=850, competition=0.3)
         world.add_environment(env1)
         world.add_environment(env2)
 
         for i in range(sim_count):
             results.append(f"\nSimulation {i+1} Start:\n")
-            sim_profit = 0
-            wage_sum = 0
-            wage_count = 0
-
-            workers = [
-                Worker(
-                    f"worker{j+1}",
-                    age=20 + j,
-                    distance=1.0 + j,
-                    previous_wage=initial_wage,
-                )
-                for j in range(worker_count)
-            ]
+            world.clear_actors()
+            pool = WorkerPool(worker_count, initial_wage)
             employer = Employer("employer1", property_size=1000)
             world.add_actor(employer)
-            for worker in workers:
-                world.add_actor(worker)
+            world.add_worker_pool(pool)
 
             env1.manifest("competition_rise", target=env2)
+            comp = env1.properties[Environment.IDX_COMPETITION]
+            population_factor = population_wage_factor(world.population)
+
+            wages, optimal_workers, profits, last_attempt, hired = negotiate_cohort(
+                employer,
+                pool.ages,
+                pool.distances,
+                pool.previous_wages,
+                population_factor,
+                comp,
+            )
+
+            results.append(
+                format_negotiation_log(
+                    pool.worker_ids(),
+                    wages,
+                    optimal_workers,
+                    profits,
+                    last_attempt,
+                    hired,
+                    NEGOTIATION_LOG_EN,
+                    NEGOTIATION_OUTCOMES_EN,
+                )
+            )
+
+            if hired.any():
+                employer.perform_pool_action("negotiate", pool, hired)
+                pool.employed |= hired
 
-            for worker in workers:
-                for attempt in range(worker.max_attempts):
-                    wage = worker.negotiate_wage(world.population)
-                    optimal_workers = employer.calculate_optimal_employment(wage)
-                    profit = employer.calculate_profit(wage, optimal_workers)
-
-                    results.append(f"{worker.id} Negotiation Attempt {attempt + 1}:\n")
-                    results.append(f"- Proposed Wage: ₩{wage:,.0f}\n")
-                    results.append(f"- Optimal Number of Workers: {optimal_workers}\n")
-                    results.append(f"- Expected Profit: ₩{profit:,.0f}\n")
-
-                    if profit > 0:
-                        sim_profit += profit
-                        wage_sum += wage
-                        wage_count += 1
-                        employer.perform_action("negotiate", worker)
-                        worker.properties["employed"] = True
-                        worker.work = "production"
-                        worker.space = employer.space
-                        results.append("→ Negotiation Successful!\n")
-                        break
-                    else:
-                        results.append("→ Negotiation Failed, Retrying...\n")
+            rows = np.flatnonzero(hired)
+            sim_profit = float(profits[rows, last_attempt[rows]].sum())
+            wage_sum = float(wages[rows, last_attempt[rows]].sum())
+            wage_count = rows.size
 
             world.update()
-            time.sleep(0.2)
-            total_profits.append(sim_profit)
-            avg_wage = wage_sum / wage_count if wage_count > 0 else 0
-            average_wages.append(avg_wage)
+            total_profits[i] = sim_profit
+            average_wages[i] = wage_sum / wage_count if wage_count > 0 else 0
+            completed = i + 1
 
         results.append("\nAll simulations completed successfully.\n")
         results.append("-" * 40 + "\n")
@@ -320,7 +533,9 @@ def run_simulation_with_plot(
         results.append(f"Simulation error occurred: {str(e)}\n")
 
     text_output = "".join(results)
-    img_output = plot_simulation_results(total_profits, average_wages)
+    img_output = plot_simulation_results(
+        total_profits[:completed], average_wages[:completed]
+    )
     return text_output, img_output
 
 
@@ -1,59 +1,68 @@
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterator, List, Optional
 import random
 import math
+import threading
 import time
 import gradio as gr
+import matplotlib
+
+matplotlib.use("Agg")  # render off-screen; the module-level figure below is never shown
 import matplotlib.pyplot as plt
 import io
-import base64
+import numpy as np
+from PIL import Image
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; negotiate_all then runs as plain NumPy
+    njit = None
 
 
+# Actors and environments are slotted dataclasses (no per-instance __dict__); eq=False keeps
+# identity comparison, since two actors with the same attributes are still different agents.
+@dataclass(slots=True, eq=False)
 class Actor:
     """Base class for all actors (agents) in the simulation."""
 
-    def __init__(self, id: str, properties: Dict[str, float]):
-        self.id = id
-        self.properties = properties
-        self.actions: List[str] = []  # record of actions this actor has taken
-        self.space: Optional["World"] = (
-            None  # reference to the world (environment space)
-        )
-        self.work: Optional[str] = None  # current work/role assignment (if any)
+    id: str
+    # reference to the world (environment space)
+    space: Optional["World"] = field(default=None, init=False, repr=False)
+    # current work/role assignment (if any)
+    work: Optional[str] = field(default=None, init=False)
 
     def perform_action(self, action_type: str, target: Optional["Actor"] = None):
         """Perform an action and optionally affect a target actor."""
-        # Record the action performed by this actor.
-        self.actions.append(action_type)
         if target:
             # If the action has a target actor, apply its effects on the target.
-            self._affect_target(target)
+            self._affect_target(target, action_type)
 
-    def _affect_target(self, target: "Actor"):
+    def _affect_target(self, target: "Actor", action_type: str):
         # Relationship (1): Actor action affecting other actors' properties.
         # For example, if this actor negotiates, increase the target actor's stress.
-        if "negotiate" in self.actions:
-            target.properties["stress"] = target.properties.get("stress", 0) + 5
+        if action_type == "negotiate":
+            target.stress += 5
 
 
+@dataclass(slots=True, eq=False)
 class Environment:
     """Represents an environment with certain properties and possible events (manifestations)."""
 
-    def __init__(self, id: str, properties: Dict[str, float]):
-        self.id = id
-        self.properties = (
-            properties  # e.g., {"demand": ..., "supply": ..., "competition": ...}
-        )
-        self.manifestations: List[str] = (
-            []
-        )  # record of events that have occurred in this environment
+    id: str
+    demand: float
+    supply: float
+    competition: float
+    # Whether a "competition_rise" event has occurred in this environment
+    # (the only manifestation that later effects depend on)
+    _competition_rose: bool = field(default=False, init=False, repr=False)
 
     def manifest(self, manifestation_type: str, target: Optional["Environment"] = None):
         """Trigger an environmental event (manifestation), optionally affecting another environment."""
-        self.manifestations.append(manifestation_type)
         # Relationship (5): Environmental attributes causing its own manifestation.
         # For example, a "competition_rise" event increases this environment's competition level.
         if manifestation_type == "competition_rise":
-            self.properties["competition"] += 0.1
+            self._competition_rose = True
+            self.competition += 0.1
         if target:
             # If a target environment is specified, this event also impacts the target environment.
             self._affect_environment(target)
@@ -61,57 +70,94 @@ class Environment:
     def _affect_environment(self, target: "Environment"):
         # Relationship (4): One environment's manifestation affecting another environment.
         # For example, increased competition here causes a 5% reduction in the target environment's demand.
-        if "competition_rise" in self.manifestations:
-            target.properties["demand"] *= 0.95
+        if self._competition_rose:
+            target.demand *= 0.95
 
     def affect_actor(self, actor: Actor):
         """Apply environmental effects on an actor (e.g., high competition increases stress)."""
         # Relationship (3): Environmental properties affecting actor attributes.
-        comp = self.properties.get("competition", 0)
+        comp = self.competition
         if comp > 0.7:
             # If competition is very high, it increases the actor's stress.
-            actor.properties["stress"] = actor.properties.get("stress", 0) + comp * 10
+            actor.stress += comp * 10
             # Relationship (7): Environmental manifestation (e.g., a high competition event) affecting actor properties (stress).
 
+    def affect_actors(self, stress: np.ndarray):
+        """Vectorized affect_actor over a block of worker stress values (updated in place)."""
+        comp = self.competition
+        if comp > 0.7:
+            stress += comp * 10
+
 
+class WorkerColumn:
+    """Worker attribute stored in the owning World's SoA column once the worker is registered.
+
+    Before World.add_actor the value is kept in a private slot on the worker ("_" + name).
+    """
+
+    def __init__(self, column: str):
+        self.column = column  # name of the World column holding this attribute
+
+    def __set_name__(self, owner: type, name: str):
+        self.slot = "_" + name
+
+    def __get__(self, worker: Optional["Worker"], owner: Optional[type] = None) -> Any:
+        if worker is None:
+            return self
+        if worker.idx < 0:
+            return getattr(worker, self.slot)
+        return getattr(worker.space, self.column)[worker.idx].item()
+
+    def __set__(self, worker: "Worker", value: Any):
+        if worker.idx < 0:
+            setattr(worker, self.slot, value)
+        else:
+            getattr(worker.space, self.column)[worker.idx] = value
+
+
+@dataclass(slots=True, eq=False)
 class Worker(Actor):
     """An Actor representing a worker seeking employment."""
 
-    def __init__(self, id: str, age: int, distance: float, previous_wage: float):
-        # Initialize base Actor with worker-specific properties
-        super().__init__(
-            id,
-            {
-                "age": age,
-                "distance": distance,
-                "previous_wage": previous_wage,
-                "employed": False,
-                "stress": 0,
-                "efficiency": 1.0,
-            },
-        )
-        # Track negotiation attempts and rules
-        self.negotiation_attempts: int = 0
-        self.max_attempts: int = 5
-        self.deduction_rate: float = 0.05  # 5% wage deduction per attempt
-
-    def negotiate_wage(self, population: int) -> float:
-        """Calculate the next wage offer based on the worker's attributes and the current population context."""
+    age: int
+    distance: float
+    previous_wage: float
+    # Track negotiation attempts
+    negotiation_attempts: int = field(default=0, init=False)
+    # row in the world's worker columns (set by World.add_actor)
+    idx: int = field(default=-1, init=False, repr=False)
+    # Initial per-tick state; read through the WorkerColumn attributes below
+    _stress: float = field(default=0, init=False, repr=False)
+    _efficiency: float = field(default=1.0, init=False, repr=False)
+    _employed: bool = field(default=False, init=False, repr=False)
+
+    # Per-tick state, backed by the world's worker columns
+    stress = WorkerColumn("_worker_stress")
+    efficiency = WorkerColumn("_worker_eff")
+    employed = WorkerColumn("_worker_employed")
+
+    # Negotiation rules (shared by all workers and by the batched negotiate_all kernel)
+    max_attempts: ClassVar[int] = 5
+    deduction_rate: ClassVar[float] = 0.05  # 5% wage deduction per attempt
+
+    def negotiate_wage(self, population_factor: float = 0.0) -> float:
+        """Calculate the next wage offer based on the worker's attributes and the current population context.
+
+        population_factor is population_wage_factor(population), computed once by the caller;
+        leave it at 0 for the population-free (v2) offer. Batched v2 offers for a whole
+        world come from World.wage_offers.
+        """
         if self.negotiation_attempts >= self.max_attempts:
             return 0  # no further negotiation attempts available
 
         # Calculate components influencing the wage demand:
-        base = self.properties["previous_wage"]  # base wage (previous salary)
+        base = self.previous_wage  # base wage (previous salary)
         distance_factor = (
-            self.properties["distance"] * 1000
+            self.distance * 1000
         )  # higher distance -> higher wage demand (travel compensation)
         age_factor = (
             self._calculate_age_factor()
         )  # if age < 30, this will be negative (less experience -> lower wage)
-        population_factor = (
-            math.log(population + 1) * 1000
-        )  # larger population -> higher wage demand (more competition for jobs)
-
         # Combine factors to determine the proposed wage
         wage = base + distance_factor + age_factor + population_factor
         # Each attempt, reduce the wage by a fixed percentage to improve chances (wage decreases by 5% per attempt made).
@@ -121,39 +167,61 @@ class Worker(Actor):
 
     def _calculate_age_factor(self) -> float:
         """Internal helper to adjust wage based on age (younger workers may have lower expected wage)."""
-        age = self.properties["age"]
+        age = self.age
         if age < 30:
             # For age below 30, return a negative value proportional to how far below 30 (reducing wage demand).
             return (age - 30) * 1000
         return 0
 
 
+def population_wage_factor(population: int) -> float:
+    """Wage premium demanded for a given population (larger population -> more competition for jobs)."""
+    return math.log(population + 1) * 1000
+
+
+@dataclass(slots=True, eq=False)
 class Employer(Actor):
     """An Actor representing an employer who can hire workers and aims to maximize profit."""
 
-    def __init__(self, id: str, property_size: float):
-        # Initialize base Actor with employer-specific properties
-        super().__init__(
-            id, {"property_size": property_size, "production": 0, "profit": 0}
-        )
-        self.workers: List[Worker] = []  # list of hired workers (initially empty)
+    # Employer-specific attributes
+    property_size: float
+    production: float = field(default=0, init=False)
+    profit: float = field(default=0, init=False)
+    stress: float = field(default=0, init=False)
+    # list of hired workers (initially empty)
+    workers: List[Worker] = field(default_factory=list, init=False, repr=False)
 
-    def calculate_optimal_employment(self, wage: float) -> int:
-        """Determine the optimal number of workers to employ at the given wage (for profit maximization)."""
+    def labor_budget(self) -> float:
+        """Ideal total labor cost: the base_prod argument of calculate_optimal_employment."""
         # Assume base production is proportional to property size (e.g., output per unit property_size)
-        base_production = self.properties["property_size"] * 1_000_000
+        base_production = self.property_size * 1_000_000
         labor_cost_ratio = 0.4  # assume 40% of production value is the ideal labor cost
-        optimal = int(base_production * labor_cost_ratio / wage)
-        return max(1, optimal)  # ensure at least 1 worker is considered
-
-    def calculate_profit(self, wage: float, num_workers: int) -> float:
-        """Calculate the expected profit if hiring num_workers at the given wage."""
-        comp = self.space.environments[0].properties[
-            "competition"
-        ]  # competition level in main environment
-        prod_per_worker = 3_500_000 * (
+        return base_production * labor_cost_ratio
+
+    def production_per_worker(self) -> float:
+        """Productivity per worker under the current competition: the prod_per_worker argument of calculate_profit."""
+        comp = self.space.environments[
+            0
+        ].competition  # competition level in main environment
+        return 3_500_000 * (
             1 + comp
         )  # base productivity per worker adjusted by competition (more competition could boost market size)
+
+    def calculate_optimal_employment(self, wage: float, base_prod: float) -> int:
+        """Determine the optimal number of workers to employ at the given wage (for profit maximization).
+
+        base_prod is labor_budget(), computed once by the caller.
+        """
+        optimal = int(base_prod / wage)
+        return max(1, optimal)  # ensure at least 1 worker is considered
+
+    def calculate_profit(
+        self, wage: float, num_workers: int, prod_per_worker: float
+    ) -> float:
+        """Calculate the expected profit if hiring num_workers at the given wage.
+
+        prod_per_worker is production_per_worker(), computed once per tick by the caller.
+        """
         production = prod_per_worker * num_workers
         cost = (
             wage * num_workers + production * 0.1
@@ -162,54 +230,176 @@ class Employer(Actor):
         return profit
 
 
+def negotiate_all(
+    prev: np.ndarray,
+    dist: np.ndarray,
+    age: np.ndarray,
+    att: np.ndarray,
+    dr: float,
+    max_attempts: int,
+) -> np.ndarray:
+    """Current wage offer of every worker in one pass (batched Worker.negotiate_wage)."""
+    age_factor = np.where(age < 30, (age - 30) * 1000, 0.0)
+    wage = (prev + dist * 1000 + age_factor) * (1 - dr * att)
+    return np.where(att < max_attempts, wage, 0.0)  # 0 once attempts are used up
+
+
+if njit is not None:
+    # Compile the same array code (no fastmath, so results match plain NumPy exactly).
+    # No cache=True: the on-disk cache is keyed to the module name, and this script is
+    # loaded both as __main__ and as an imported module.
+    negotiate_all = njit(negotiate_all)
+
+
+def _grow(column: np.ndarray, capacity: int, fill) -> np.ndarray:
+    """Return a copy of column resized to capacity, padding new rows with fill."""
+    grown = np.full(capacity, fill, dtype=column.dtype)
+    grown[: column.shape[0]] = column
+    return grown
+
+
 class World:
     """The simulation world containing all actors and environments, and handling their interactions per tick."""
 
     def __init__(self):
         self.actors: List[Actor] = []
+        # Actors partitioned by type at add_actor time, so tick code needs no isinstance filtering.
+        # workers[i] is the worker owning row i of the worker columns below.
+        self.workers: List[Worker] = []
+        self.employers: List[Employer] = []
+        self._employed_count: int = (
+            0  # number of employed workers, maintained by hire()
+        )
         self.environments: List[Environment] = []
         self.population: int = (
             0  # global population context (could influence actor decisions)
         )
+        # Per-worker state kept as parallel columns (structure of arrays); worker i owns row i.
+        # Columns are allocated with spare capacity; only the first _worker_count rows are live.
+        self._worker_count: int = 0
+        self._worker_stress = np.zeros(0, dtype=np.float64)
+        self._worker_eff = np.ones(0, dtype=np.float64)
+        self._worker_employed = np.zeros(0, dtype=np.bool_)
+        # Static negotiation inputs, read by wage_offers() in one batched call per tick.
+        self._worker_age = np.zeros(0, dtype=np.float64)
+        self._worker_distance = np.zeros(0, dtype=np.float64)
+        self._worker_prev_wage = np.zeros(0, dtype=np.float64)
 
     def add_actor(self, actor: Actor):
         """Add an actor to the world and link the world to the actor."""
         self.actors.append(actor)
+        if isinstance(actor, Worker):
+            self.workers.append(actor)
+            self._register_worker(actor)
+        elif isinstance(actor, Employer):
+            self.employers.append(actor)
         actor.space = self
 
+    def _register_worker(self, worker: "Worker"):
+        """Give the worker a row in the SoA columns, seeded from its current attributes."""
+        if self._worker_count == self._worker_stress.shape[0]:
+            # Grow geometrically so repeated add_actor calls stay amortized O(1).
+            capacity = max(8, 2 * self._worker_count)
+            self._worker_stress = _grow(self._worker_stress, capacity, 0.0)
+            self._worker_eff = _grow(self._worker_eff, capacity, 1.0)
+            self._worker_employed = _grow(self._worker_employed, capacity, False)
+            self._worker_age = _grow(self._worker_age, capacity, 0.0)
+            self._worker_distance = _grow(self._worker_distance, capacity, 0.0)
+            self._worker_prev_wage = _grow(self._worker_prev_wage, capacity, 0.0)
+        idx = self._worker_count
+        self._worker_stress[idx] = worker.stress
+        self._worker_eff[idx] = worker.efficiency
+        self._worker_employed[idx] = worker.employed
+        self._worker_age[idx] = worker.age
+        self._worker_distance[idx] = worker.distance
+        self._worker_prev_wage[idx] = worker.previous_wage
+        worker.idx = idx
+        self._worker_count += 1
+        self._employed_count += bool(self._worker_employed[idx])
+
+    def clear_actors(self):
+        """
+        Remove all actors so the next cohort starts from an empty world. The worker columns
+        keep their capacity and are refilled from row 0; removed workers get their current
+        state copied back so they no longer read rows reused by the new cohort.
+        """
+        for worker in self.workers:
+            worker._stress = worker.stress
+            worker._efficiency = worker.efficiency
+            worker._employed = worker.employed
+            worker.idx = -1
+        self.actors.clear()
+        self.workers.clear()
+        self.employers.clear()
+        self._worker_count = 0
+        self._employed_count = 0
+
+    def hire(self, worker: "Worker"):
+        """Mark a worker in this world as employed, keeping the employed count in step."""
+        if not worker.employed:
+            worker.employed = True
+            self._employed_count += 1
+
+    def wage_offers(self, attempts: np.ndarray) -> np.ndarray:
+        """Wage offer of every registered worker (row i = worker.idx) given its attempt count."""
+        n = self._worker_count
+        return negotiate_all(
+            self._worker_prev_wage[:n],
+            self._worker_distance[:n],
+            self._worker_age[:n],
+            attempts,
+            Worker.deduction_rate,
+            Worker.max_attempts,
+        )
+
+    def negotiation_tick(
+        self, attempts: np.ndarray, employer: "Employer", prod_per_worker: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Wage offer, single-worker profit and hire decision for every registered worker this tick.
+        A worker is hired if the profit is positive, its efficiency is at least 0.6 and it is
+        not already employed.
+        """
+        n = self._worker_count
+        offers = self.wage_offers(attempts)
+        profits = employer.calculate_profit(offers, 1, prod_per_worker)
+        hired = (
+            (profits > 0) & (self._worker_eff[:n] >= 0.6) & ~self._worker_employed[:n]
+        )
+        return offers, profits, hired
+
     def add_environment(self, environment: Environment):
         """Add an environment to the world."""
         self.environments.append(environment)
 
     def update(self):
         """Update the state of the world for one time tick (apply interactions)."""
+        stress = self._worker_stress[: self._worker_count]
         # First, each environment affects each actor (e.g., apply stress from high competition).
+        # Workers are handled as one block over the stress column; other actors individually.
         for env in self.environments:
-            for actor in self.actors:
-                env.affect_actor(actor)
-        # Then, update each actor's internal state based on effects (e.g., adjust efficiency based on stress).
-        for actor in self.actors:
-            if "stress" in actor.properties and "efficiency" in actor.properties:
-                stress = actor.properties["stress"]
-                # Efficiency decreases with stress (1% efficiency loss per stress point), bottoming out at 50% efficiency.
-                actor.properties["efficiency"] = max(0.5, 1.0 - 0.01 * stress)
+            env.affect_actors(stress)
+            for employer in self.employers:
+                env.affect_actor(employer)
+        # Then, update each worker's efficiency based on stress (1% efficiency loss per stress point),
+        # bottoming out at 50% efficiency. Computed in place in the efficiency column (no temporaries).
+        eff = self._worker_eff[: self._worker_count]
+        np.multiply(stress, -0.01, out=eff)
+        eff += 1.0
+        np.clip(eff, 0.5, 1.0, out=eff)
         # Finally, actors' behaviors influence the environment (e.g., production from hired workers increases supply).
-        for actor in self.actors:
-            if isinstance(actor, Employer):
-                # Relationship (6): Actor behavior affecting the environment.
-                # If the employer hired workers, increase supply in the main market environment and slightly reduce demand (market saturation).
-                employed_count = sum(
-                    1
-                    for a in self.actors
-                    if isinstance(a, Worker) and a.properties.get("employed")
+        for employer in self.employers:
+            # Relationship (6): Actor behavior affecting the environment.
+            # If the employer hired workers, increase supply in the main market environment and slightly reduce demand (market saturation).
+            if self.environments:
+                self.environments[0].supply += (
+                    self._employed_count * 1000
+                )  # each employed worker adds to supply
+                self.environments[
+                    0
+                ].demand *= (
+                    0.99  # demand decreases by 1% due to increased supply (if any)
                 )
-                if self.environments:
-                    self.environments[0].properties["supply"] += (
-                        employed_count * 1000
-                    )  # each employed worker adds to supply
-                    self.environments[0].properties[
-                        "demand"
-                    ] *= 0.99  # demand decreases by 1% due to increased supply (if any)
 
 
 def run_simulation(
@@ -223,8 +413,8 @@ def run_simulation(
     Run the simulation multiple times (ticks) without graphical output.
     Returns a detailed log of the simulation as a string.
     """
-    results: List[str] = []
-    results.append(
+    log = io.StringIO()  # log text is written into one growing buffer
+    log.write(
         "시뮬레이션 환경 초기화 중...\n"
     )  # (Initializing simulation environment...)
     try:
@@ -232,19 +422,19 @@ def run_simulation(
         world = World()
         world.population = initial_population  # set initial population context
         env1 = Environment(
-            "market", {"demand": 1000, "supply": 800, "competition": market_competition}
-        )
-        env2 = Environment(
-            "secondary", {"demand": 900, "supply": 850, "competition": 0.3}
+            "market", demand=1000, supply=800, competition=market_competition
         )
+        env2 = Environment("secondary", demand=900, supply=850, competition=0.3)
         world.add_environment(env1)
         world.add_environment(env2)
         # The same environments persist through all simulation iterations, allowing their state to evolve over time.
         for i in range(sim_count):
-            results.append(
+            log.write(
                 f"\n시뮬레이션 {i+1} 시작:\n"
             )  # Start of simulation iteration i+1
-            # Create an employer and multiple workers for this tick
+            # Create an employer and multiple workers for this tick, replacing the previous tick's
+            # cohort (otherwise the actor lists, and every update() over them, grow each tick)
+            world.clear_actors()
             workers = [
                 Worker(
                     f"worker{j+1}",
@@ -261,83 +451,99 @@ def run_simulation(
                 world.add_actor(worker)
             # Environment event: competition rises in the main market environment, affecting the secondary environment
             env1.manifest("competition_rise", target=env2)
+            # Quantities that stay constant for the whole tick are computed once, outside the negotiation loop
+            pop_factor = population_wage_factor(world.population)
+            base_prod = employer.labor_budget()
+            prod_per_worker = employer.production_per_worker()
             # Wage negotiation between the employer and each worker
             for worker in workers:
                 for attempt in range(worker.max_attempts):
-                    wage = worker.negotiate_wage(world.population)
-                    optimal_workers = employer.calculate_optimal_employment(wage)
-                    profit = employer.calculate_profit(wage, optimal_workers)
+                    wage = worker.negotiate_wage(pop_factor)
+                    optimal_workers = employer.calculate_optimal_employment(
+                        wage, base_prod
+                    )
+                    profit = employer.calculate_profit(
+                        wage, optimal_workers, prod_per_worker
+                    )
                     # Log the negotiation attempt and calculated outcomes
-                    results.append(
+                    log.write(
                         f"{worker.id} 협상 시도 {attempt + 1}:\n"
                     )  # (Negotiation attempt {n})
-                    results.append(f"- 제시 임금: {wage:,.0f}원\n")  # (Proposed Wage)
-                    results.append(
+                    log.write(f"- 제시 임금: {wage:,.0f}원\n")  # (Proposed Wage)
+                    log.write(
                         f"- 최적 고용자 수: {optimal_workers}명\n"
                     )  # (Optimal number of workers)
-                    results.append(
-                        f"- 예상 이익: {profit:,.0f}원\n"
-                    )  # (Expected profit)
+                    log.write(f"- 예상 이익: {profit:,.0f}원\n")  # (Expected profit)
                     if profit > 0:
                         # If profit is positive, the employer hires the worker (profit-driven decision to employ)
                         employer.perform_action("negotiate", worker)
-                        worker.properties["employed"] = True
+                        world.hire(worker)
                         worker.work = (
                             "생산"  # assign work (production) to the hired worker
                         )
                         worker.space = employer.space
-                        results.append("→ 협상 성공!\n")  # (Negotiation successful!)
+                        log.write("→ 협상 성공!\n")  # (Negotiation successful!)
                         break  # exit the attempt loop for this worker, move to next worker
                     else:
-                        results.append(
+                        log.write(
                             "→ 협상 실패, 재시도...\n"
                         )  # (Negotiation failed, retrying...)
             # Update the world state at the end of this tick (actors and environments)
             world.update()
-            time.sleep(0.2)  # brief pause to simulate time progression
-        results.append(
+        log.write(
             "\n모든 시뮬레이션이 완료되었습니다!\n"
         )  # (All simulations completed!)
-        results.append("-" * 40 + "\n")
+        log.write("-" * 40 + "\n")
     except Exception as e:
-        results.append(
+        log.write(
             f"시뮬레이션 중 오류 발생: {str(e)}\n"
         )  # (Error occurred during simulation)
-    return "".join(results)
+    return log.getvalue()
+
+
+# One figure is built at import and redrawn for every request; the lock serializes
+# concurrent Gradio calls, which would otherwise draw into the same axes.
+_FIG, (_AX1, _AX2) = plt.subplots(2, 1, figsize=(7, 8))
+_FIG_LOCK = threading.Lock()
 
 
 def plot_simulation_results(
     profits_per_simulation: List[float], average_wages: List[float]
-) -> str:
-    """Generate a plot for total profit and average wage across simulations, and return it as an HTML image."""
-    # Create a figure with two subplots: one for profit, one for average wage
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 8))
-    # Plot total profit per simulation
-    ax1.plot(
-        range(1, len(profits_per_simulation) + 1), profits_per_simulation, marker="o"
-    )
-    ax1.set_title("Total Profit per Simulation")
-    ax1.set_xlabel("Simulation Number")
-    ax1.set_ylabel("Total Profit (₩)")
-    ax1.grid(True)
-    # Plot average wage per simulation
-    ax2.plot(
-        range(1, len(average_wages) + 1), average_wages, marker="x", color="orange"
-    )
-    ax2.set_title("Average Wage per Simulation")
-    ax2.set_xlabel("Simulation Number")
-    ax2.set_ylabel("Average Wage (₩)")
-    ax2.grid(True)
-    plt.tight_layout()
-    # Save plot to a buffer and encode as base64
-    buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    image_base64 = base64.b64encode(buf.read()).decode("utf-8")
-    buf.close()
-    plt.close(fig)
-    # Return an HTML <img> tag with the base64-encoded image
-    return f"<img src='data:image/png;base64,{image_base64}'/>"
+) -> Image.Image:
+    """Generate a plot for total profit and average wage across simulations, and return it as a PIL image."""
+    with _FIG_LOCK:
+        # Reuse the shared figure: clear both subplots (profit, average wage) and redraw
+        _AX1.clear()
+        _AX2.clear()
+        # Plot total profit per simulation
+        _AX1.plot(
+            range(1, len(profits_per_simulation) + 1),
+            profits_per_simulation,
+            marker="o",
+        )
+        _AX1.set_title("Total Profit per Simulation")
+        _AX1.set_xlabel("Simulation Number")
+        _AX1.set_ylabel("Total Profit (₩)")
+        _AX1.grid(True)
+        # Plot average wage per simulation
+        _AX2.plot(
+            range(1, len(average_wages) + 1), average_wages, marker="x", color="orange"
+        )
+        _AX2.set_title("Average Wage per Simulation")
+        _AX2.set_xlabel("Simulation Number")
+        _AX2.set_ylabel("Average Wage (₩)")
+        _AX2.grid(True)
+        _FIG.tight_layout()
+        # Render and copy the canvas pixels out before the next call redraws them;
+        # Gradio encodes the image itself, so no PNG/base64 step is needed here
+        _FIG.canvas.draw()
+        return Image.frombytes(
+            "RGBA", _FIG.canvas.get_width_height(), bytes(_FIG.canvas.buffer_rgba())
+        )
+
+
+# Minimum time between intermediate plot redraws while streaming (each render costs ~0.1 s)
+PLOT_REFRESH_SECONDS = 1.0
 
 
 # 변경된 run_simulation_with_plot 함수 예시:
@@ -347,17 +553,26 @@ def run_simulation_with_plot(
     sim_count: int,
     _unused_population: int,
     worker_count: int,
-) -> tuple[str, str]:
-    results = ["📘 Initializing simulation environment...\n"]
+    verbose: bool = True,
+) -> Iterator[tuple[str, Image.Image]]:
+    """
+    Run the persistent-world simulation, yielding (log so far, plot so far) after every tick
+    so the Gradio UI can stream progress. The plot is redrawn on the last tick and otherwise at
+    most every PLOT_REFRESH_SECONDS (the previous image, or None, is sent in between).
+    The last item carries the complete log and plot.
+    With verbose=False the per-worker negotiation lines are skipped.
+    """
+    log = io.StringIO()
+    log.write("📘 Initializing simulation environment...\n")
     total_profits = []
     average_wages = []
 
     # ✅ 상태 유지용 객체는 반복문 밖에서 생성하여 누적 구조 유지
     world = World()
     env1 = Environment(
-        "market", {"demand": 1000, "supply": 800, "competition": market_competition}
+        "market", demand=1000, supply=800, competition=market_competition
     )
-    env2 = Environment("secondary", {"demand": 900, "supply": 850, "competition": 0.3})
+    env2 = Environment("secondary", demand=900, supply=850, competition=0.3)
     world.add_environment(env1)
     world.add_environment(env2)
 
@@ -366,78 +581,92 @@ def run_simulation_with_plot(
     world.add_actor(employer)
 
     # ✅ 누적 노동자 풀 (스트레스 등 상태 유지됨)
-    import numpy as np
-
+    # 노동자 속성은 속성별로 한 번에 추출
+    rng = np.random.default_rng()
+    n_workers = max(worker_count, 0)
+    ages = rng.integers(20, 60, size=n_workers)
+    distances = rng.uniform(1.0, 5.0, size=n_workers).round(2)
+    previous_wages = rng.integers(
+        int(initial_wage * 0.8), int(initial_wage * 1.2), size=n_workers
+    )
     workers = [
         Worker(
             f"worker{j+1}",
-            age=np.random.randint(20, 60),
-            distance=round(np.random.uniform(1.0, 5.0), 2),
-            previous_wage=np.random.randint(
-                int(initial_wage * 0.8), int(initial_wage * 1.2)
-            ),
+            age=int(ages[j]),
+            distance=float(distances[j]),
+            previous_wage=float(previous_wages[j]),
         )
-        for j in range(worker_count)
+        for j in range(n_workers)
     ]
     for w in workers:
         world.add_actor(w)
 
+    plot = None  # latest rendered plot, re-sent until the next redraw
+    last_draw = time.monotonic()
     for i in range(sim_count):
-        results.append(f"\n🔁 Tick {i+1}\n")
+        log.write(f"\n🔁 Tick {i+1}\n")
         sim_profit = 0.0
         wage_sum = 0.0
         wage_count = 0
 
         env1.manifest("competition_rise", target=env2)  # 환경 변화 발생 (누적됨)
 
-        for worker in workers:
-            if worker.properties.get("employed"):
-                continue  # 이미 고용된 경우 생략
-
-            for attempt in range(worker.max_attempts):
-                wage = worker.negotiate_wage()  # ✅ population 제거
-                optimal_workers = employer.calculate_optimal_employment(wage)
-                profit = employer.calculate_profit(wage, 1)  # 단일 노동자 기준
-                efficiency = worker.properties.get("efficiency", 1.0)
-
-                results.append(
-                    f"{worker.id} (eff={efficiency:.2f}) Attempt {attempt+1}: wage={wage:,.0f}, profit={profit:,.0f}\n"
+        # 이번 틱의 임금 제안·이윤·채용 여부를 전체 노동자에 대해 한 번에 계산
+        # (시도 횟수가 늘지 않으므로 매 시도의 제안이 같음 → 채용 여부는 노동자당 한 번에 결정)
+        n = len(world.workers)
+        attempts = np.fromiter(
+            (w.negotiation_attempts for w in world.workers), dtype=np.int64, count=n
+        )
+        prod_per_worker = (
+            employer.production_per_worker()
+        )  # 틱 내 불변값은 한 번만 계산
+        offers, profits, hired = world.negotiation_tick(
+            attempts, employer, prod_per_worker
+        )  # 이윤은 단일 노동자 기준
+        efficiency = world._worker_eff[:n]
+
+        # 아직 고용되지 않은 노동자만 순회 (행 번호 = worker.idx = world.workers 내 위치)
+        for idx in np.flatnonzero(~world._worker_employed[:n]).tolist():
+            worker = world.workers[idx]
+            wage, profit = offers[idx], profits[idx]
+            if verbose:
+                attempt_log = (
+                    f"{worker.id} (eff={efficiency[idx]:.2f}) Attempt {{}}: "
+                    f"wage={wage:,.0f}, profit={profit:,.0f}\n"
                 )
 
-                if profit > 0 and efficiency >= 0.6:
-                    sim_profit += profit
-                    wage_sum += wage
-                    wage_count += 1
-                    employer.perform_action("negotiate", worker)
-                    worker.properties["employed"] = True
-                    worker.work = "production"
-                    results.append("→ ✅ Hired\n")
-                    break
-                else:
-                    results.append("→ ❌ Rejected\n")
+            if hired[idx]:
+                if verbose:
+                    log.write(attempt_log.format(1))
+                    log.write("→ ✅ Hired\n")
+                sim_profit += profit
+                wage_sum += wage
+                wage_count += 1
+                employer.perform_action("negotiate", worker)
+                world.hire(worker)
+                worker.work = "production"
+            elif verbose:
+                for attempt in range(Worker.max_attempts):
+                    log.write(attempt_log.format(attempt + 1))
+                    log.write("→ ❌ Rejected\n")
 
         world.update()
         total_profits.append(sim_profit)
         avg_wage = wage_sum / wage_count if wage_count > 0 else 0
         average_wages.append(avg_wage)
-        time.sleep(0.1)
+        # 틱마다 로그를 내보내 UI가 진행 상황을 바로 표시; 그래프는 마지막 틱 또는 일정 간격으로만 다시 그림
+        now = time.monotonic()
+        if i == sim_count - 1 or now - last_draw >= PLOT_REFRESH_SECONDS:
+            plot = plot_simulation_results(total_profits, average_wages)
+            last_draw = now
+        yield log.getvalue(), plot
 
-    results.append("\n✔ All ticks completed.\n")
-    return "".join(results), plot_simulation_results(total_profits, average_wages)
+    log.write("\n✔ All ticks completed.\n")
+    if plot is None:  # no ticks ran
+        plot = plot_simulation_results(total_profits, average_wages)
+    yield log.getvalue(), plot
 
 
-# ✅ Worker 내부 wage 계산 함수도 population 제거 필요
-Worker.negotiate_wage = lambda self: (
-    (
-        self.properties["previous_wage"]
-        + self.properties["distance"] * 1000
-        + ((self.properties["age"] - 30) * 1000 if self.properties["age"] < 30 else 0)
-    )
-    * (1 - self.deduction_rate * self.negotiation_attempts)
-    if self.negotiation_attempts < self.max_attempts
-    else 0 if not self.properties.get("employed") else 0
-)
-
 iface = gr.Interface(
     fn=run_simulation_with_plot,
     inputs=[
@@ -451,7 +680,7 @@ iface = gr.Interface(
     ],
     outputs=[
         gr.Textbox(label="Simulation Results", lines=20),
-        gr.HTML(label="Simulation Graphs"),
+        gr.Image(type="pil", label="Simulation Graphs"),
     ],
     title="PDF 정확 반영 시뮬레이션 (v2, no population)",
     description="population 개념 제거 및 PDF 기준에 따른 임금 산정 구조 반영 버전.",